@@ -343,8 +343,7 @@ class CategoryAnnotation(Annotation):
         :param key: A key to a sub category.
         """
 
-        if key in self.sub_categories:
-            self.sub_categories.pop(key)
+        self.sub_categories.pop(key, None)
 
     def dump_relationship(self, key: TypeOrStr, annotation_id: str) -> None:
         """
@@ -357,11 +356,9 @@ class CategoryAnnotation(Annotation):
         if not is_uuid_like(annotation_id):
             raise UUIDError("Annotation_id must be uuid")
 
-        key_type = get_type(key)
-        if key not in self.relationships:
-            self.relationships[key_type] = []
-        if annotation_id not in self.relationships[key_type]:
-            self.relationships[key_type].append(annotation_id)
+        relationship_ids = self.relationships.setdefault(get_type(key), [])
+        if annotation_id not in relationship_ids:
+            relationship_ids.append(annotation_id)
 
     def get_relationship(self, key: ObjectTypes) -> List[str]:
         """
@@ -370,9 +367,7 @@ class CategoryAnnotation(Annotation):
         :param key: The key for the required relationship.
         :return: Get a (possibly) empty list of annotation ids.
         """
-        if key in self.relationships:
-            return self.relationships[key]
-        return []
+        return self.relationships.get(key, [])
 
     def remove_relationship(self, key: ObjectTypes, annotation_ids: Optional[Union[List[str], str]] = None) -> None:
         """
@@ -354,7 +354,9 @@ class Image:
                 else [get_type(category_names)]  # type:ignore
             )
 
-        ann_ids = [annotation_ids] if isinstance(annotation_ids, str) else annotation_ids
+        ann_ids: Optional[Set[str]] = None
+        if annotation_ids is not None:
+            ann_ids = {annotation_ids} if isinstance(annotation_ids, str) else set(annotation_ids)
         service_id = [service_id] if isinstance(service_id, str) else service_id
         model_id = [model_id] if isinstance(model_id, str) else model_id
         session_id = [session_ids] if isinstance(session_ids, str) else session_ids
@@ -566,10 +568,8 @@ class Image:
             image.set_embedding(image_id, BoundingBox.from_dict(**box_dict))
         for ann_dict in kwargs.get("annotations"):
             image_ann = ImageAnnotation.from_dict(**ann_dict)
-            if "image" in ann_dict:
-                image_dict = ann_dict["image"]
-                if image_dict:
-                    image_ann.image = cls.from_dict(**image_dict)
+            if image_dict := ann_dict.get("image"):
+                image_ann.image = cls.from_dict(**image_dict)
             image.dump(image_ann)
         if summary_dict := kwargs.get("_summary", kwargs.get("summary")):
             image.summary = SummaryAnnotation.from_dict(**summary_dict)
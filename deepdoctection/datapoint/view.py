@@ -145,7 +145,7 @@ class ImageAnnotationBaseView(ImageAnnotation):
         attribute_names = {"bbox", "np_image"}.union({cat.value for cat in self.sub_categories})
         if self.image:
             if self.image.summary:
-                attribute_names = attribute_names.union({cat.value for cat in self.image.summary.sub_categories.keys()})
+                attribute_names = attribute_names.union({cat.value for cat in self.image.summary.sub_categories})
         return attribute_names
 
     @classmethod
@@ -312,13 +312,15 @@ class Table(Layout):
             if isinstance(ann, ContainerAnnotation):
                 if isinstance(ann.value, list):
                     html_list = copy(ann.value)
+        html_index_by_id: Dict[str, int] = {}
+        for position, html_token in enumerate(html_list):
+            html_index_by_id.setdefault(html_token, position)
         for cell in self.cells:
-            try:
-                html_index = html_list.index(cell.annotation_id)
-                html_list.pop(html_index)
-                html_list.insert(html_index, cell.text)  # type: ignore
-            except ValueError:
+            html_index = html_index_by_id.get(cell.annotation_id)
+            if html_index is None:
                 logger.warning(LoggingRecord("html construction not possible", {"annotation_id": cell.annotation_id}))
+                continue
+            html_list[html_index] = cell.text  # type: ignore
 
         return "".join(html_list)
 
@@ -527,7 +529,9 @@ class Page(Image):
                 if isinstance(category_names, list)
                 else [get_type(category_names)]  # type:ignore
             )
-        ann_ids = [annotation_ids] if isinstance(annotation_ids, str) else annotation_ids
+        ann_ids: Optional[Set[str]] = None
+        if annotation_ids is not None:
+            ann_ids = {annotation_ids} if isinstance(annotation_ids, str) else set(annotation_ids)
         service_id = [service_id] if isinstance(service_id, str) else service_id
         model_id = [model_id] if isinstance(model_id, str) else model_id
         session_id = [session_ids] if isinstance(session_ids, str) else session_ids
@@ -641,13 +645,9 @@ class Page(Image):
         for ann_dict in img_kwargs.get("annotations", []):
             image_ann = ImageAnnotation.from_dict(**ann_dict)
             layout_ann = ann_obj_view_factory(image_ann, text_container)
-            if "image" in ann_dict:
-                image_dict = ann_dict["image"]
-                if image_dict:
-                    image = Image.from_dict(**image_dict)
-                    layout_ann.image = cls.from_image(
-                        image, text_container, floating_text_block_categories, base_page=page
-                    )
+            if image_dict := ann_dict.get("image"):
+                image = Image.from_dict(**image_dict)
+                layout_ann.image = cls.from_image(image, text_container, floating_text_block_categories, base_page=page)
             layout_ann.base_page = base_page if base_page is not None else page
             page.dump(layout_ann)
         if summary_dict := img_kwargs.get("_summary"):
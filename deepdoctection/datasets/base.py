@@ -308,8 +308,8 @@ class MergeDataset(DatasetBase):
         test_dataset = None
 
         if add_test:
-            test_dataset = [dp for id, dp in enumerate(val_dataset) if id % 2]
-            val_dataset = [dp for id, dp in enumerate(val_dataset) if not id % 2]
+            test_dataset = val_dataset[1::2]
+            val_dataset = val_dataset[::2]
 
         logger.info(LoggingRecord("___________________ Number of datapoints per split ___________________"))
         logger.info(
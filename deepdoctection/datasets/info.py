@@ -401,17 +401,15 @@ def get_merged_categories(*categories: DatasetCategories) -> DatasetCategories:
 
     # select categories with sub categories. Only categories that appear in this list can be candidates for having
     # sub categories in the merged dataset
-    intersect_sub_cat_keys = set(categories[0].init_sub_categories.keys()).intersection(
-        *[cat.init_sub_categories.keys() for cat in categories[1:]]
+    intersect_sub_cat_keys = set(categories[0].init_sub_categories).intersection(
+        *[cat.init_sub_categories for cat in categories[1:]]
     )
     intersect_init_sub_cat = {}
     for key in intersect_sub_cat_keys:
         # select all sub categories from all datasets for a given key
         sub_cat_per_key = [cat.init_sub_categories[key] for cat in categories]
         # select only sub categories that appear in all datasets
-        intersect_sub_cat_per_key = set(sub_cat_per_key[0].keys()).intersection(
-            *[sub_cats.keys() for sub_cats in sub_cat_per_key[1:]]
-        )
+        intersect_sub_cat_per_key = set(sub_cat_per_key[0]).intersection(*sub_cat_per_key[1:])
         # form a set of possible sub category values. To get a list of all values from all dataset, take the union
         intersect_init_sub_cat_values = {}
         for sub_cat_key in intersect_sub_cat_per_key:
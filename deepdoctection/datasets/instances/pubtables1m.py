@@ -149,8 +149,7 @@ class Pubtables1MBuilder(DataFlowBaseBuilder):
 
         @curry
         def load_xml(path_ann: str, utf8_parser: etree.XMLParser) -> JsonDict:
-            with open(path_ann, "r", encoding="utf-8") as xml_file:
-                root = etree.fromstring(xml_file.read().encode("utf_8"), parser=utf8_parser)
+            root = etree.parse(path_ann, parser=utf8_parser).getroot()
             return {"file_name": path_ann, "xml": root}
 
         df = MapData(df, load_xml(utf8_parser))  # pylint: disable=E1120
@@ -268,8 +267,7 @@ class Pubtables1MBuilderStruct(DataFlowBaseBuilder):
 
         @curry
         def load_xml(path_ann: str, utf8_parser: etree.XMLParser) -> JsonDict:
-            with open(path_ann, "r", encoding="utf-8") as xml_file:
-                root = etree.fromstring(xml_file.read().encode("utf_8"), parser=utf8_parser)
+            root = etree.parse(path_ann, parser=utf8_parser).getroot()
             return {"file_name": path_ann, "xml": root}
 
         df = MapData(df, load_xml(utf8_parser))  # pylint: disable=E1120
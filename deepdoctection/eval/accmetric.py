@@ -240,7 +240,7 @@ class ClassificationMetric(MetricBase):
 
         for image_id, dp_labels_gt in labels_per_image_gt.items():
             dp_labels_predictions = labels_per_image_predictions[image_id]
-            for key in dp_labels_gt.keys():
+            for key in dp_labels_gt:
                 if key not in labels_gt:
                     labels_gt[key] = dp_labels_gt[key]
                     labels_predictions[key] = dp_labels_predictions[key]
@@ -418,12 +418,10 @@ class ConfusionMetric(ClassificationMetric):
 
     @classmethod
     def print_result(cls) -> None:
-        data = {}
+        data: Dict[Any, List[Any]] = {}
         for entry in cls._results:
-            if entry["category_id_gt"] not in data:
-                data[entry["category_id_gt"]] = [entry["category_id_gt"], entry["val"]]
-            else:
-                data[entry["category_id_gt"]].append(entry["val"])
+            category_id_gt = entry["category_id_gt"]
+            data.setdefault(category_id_gt, [category_id_gt]).append(entry["val"])
 
         header = ["predictions -> \n  ground truth |\n              v"] + list(data.keys())
         table = tabulate([data[k] for k, _ in enumerate(data, 1)], headers=header, tablefmt="pipe")
@@ -107,47 +107,56 @@ class TEDS:
 
     def __init__(self, structure_only: bool = False):
         self.structure_only = structure_only
-        self.__tokens__: List[str] = []
 
-    def tokenize(self, node: TableTree) -> None:
+    @staticmethod
+    def tokenize(node: TableTree) -> List[str]:
         """Tokenizes table cells"""
-        self.__tokens__.append(f"<{node.tag}>")
-        if node.text is not None:
-            self.__tokens__ += list(node.text)
-        for n in node.getchildren():
-            self.tokenize(n)
-        if node.tag != "unk":
-            self.__tokens__.append(f"</{node.tag}>")
-        if node.tag != "td" and node.tail is not None:
-            self.__tokens__ += list(node.tail)
+        tokens: List[str] = []
+
+        def _tokenize(element: Any) -> None:
+            tag = element.tag
+            tokens.append(f"<{tag}>")
+            if element.text is not None:
+                tokens.extend(element.text)
+            for child in element:
+                _tokenize(child)
+            if tag != "unk":
+                tokens.append(f"</{tag}>")
+            if tag != "td" and element.tail is not None:
+                tokens.extend(element.tail)
+
+        _tokenize(node)
+        return tokens
 
     def load_html_tree(self, node: TableTree, parent: Optional[TableTree] = None) -> Optional[TableTree]:
         """Converts HTML tree to the format required by apted"""
-        global __tokens__  # pylint: disable = W0602
-        if node.tag == "td":
-            if self.structure_only:
-                cell = []
+        root = None
+        stack: List[Tuple[Any, Optional[TableTree]]] = [(node, parent)]
+        while stack:
+            element, element_parent = stack.pop()
+            tag = element.tag
+            if tag == "td":
+                if self.structure_only:
+                    cell = []
+                else:
+                    cell = self.tokenize(element)[1:-1]
+                new_node = TableTree(
+                    *deque(),
+                    tag=tag,
+                    colspan=int(element.attrib.get("colspan", "1")),
+                    rowspan=int(element.attrib.get("rowspan", "1")),
+                    content=cell,
+                )
             else:
-                self.__tokens__ = []
-                self.tokenize(node)
-                cell = self.__tokens__[1:-1].copy()
-            new_node = TableTree(
-                *deque(),
-                tag=node.tag,
-                colspan=int(node.attrib.get("colspan", "1")),
-                rowspan=int(node.attrib.get("rowspan", "1")),
-                content=cell,
-            )
-        else:
-            new_node = TableTree(*deque(), tag=node.tag, rowspan=None, colspan=None, content=None)
-        if parent is not None:
-            parent.children.append(new_node)
-        if node.tag != "td":
-            for n in node.getchildren():
-                self.load_html_tree(n, new_node)
-        if parent is None:
-            return new_node
-        return None
+                new_node = TableTree(*deque(), tag=tag, rowspan=None, colspan=None, content=None)
+            if element_parent is not None:
+                element_parent.children.append(new_node)
+            else:
+                root = new_node
+            if tag != "td":
+                # reversed, so that children are popped and appended in document order
+                stack.extend((child, new_node) for child in reversed(element))
+        return root
 
     def evaluate(self, inputs: Tuple[str, str]) -> float:
         """Computes TEDS score between the prediction and the ground truth of a
@@ -177,8 +186,8 @@ class TEDS:
 
         etree.strip_tags(pred_tr)
         etree.strip_tags(ground_truth_tr)
-        n_nodes_pred = len(pred_tr.xpath(".//*"))  # type: ignore
-        n_nodes_true = len(ground_truth_tr.xpath(".//*"))  # type: ignore
+        n_nodes_pred = sum(1 for _ in pred_tr.iterdescendants(etree.Element))  # type: ignore
+        n_nodes_true = sum(1 for _ in ground_truth_tr.iterdescendants(etree.Element))  # type: ignore
         n_nodes = max(n_nodes_pred, n_nodes_true)
         tree_pred = self.load_html_tree(pred_tr)  # type: ignore
         tree_true = self.load_html_tree(ground_truth_tr)  # type: ignore
@@ -33,7 +33,7 @@ from .base import DetectionResult, ObjectDetector
 from .pt.ptutils import get_torch_device
 
 with try_import() as pt_import_guard:
-    import torch  # pylint: disable=W0611
+    import torch
     from torchvision.ops import boxes as box_ops  # type: ignore
 
 with try_import() as tr_import_guard:
@@ -76,18 +76,19 @@ def detr_predict_image(
     inputs = feature_extractor(images=np_img, return_tensors="pt")
     inputs.data["pixel_values"] = inputs.data["pixel_values"].to(device)
     inputs.data["pixel_mask"] = inputs.data["pixel_mask"].to(device)
-    outputs = predictor(**inputs)
-    outputs["encoder_last_hidden_state"] = outputs["encoder_last_hidden_state"].to("cpu")
-    outputs["last_hidden_state"] = outputs["last_hidden_state"].to("cpu")
-    outputs["logits"] = outputs["logits"].to("cpu")
-    outputs["pred_boxes"] = outputs["pred_boxes"].to("cpu")
-    results = feature_extractor.post_process_object_detection(outputs, threshold=threshold, target_sizes=target_sizes)[
-        0
-    ]
-    keep = _detr_post_processing(results["boxes"], results["scores"], results["labels"], nms_threshold)
-    keep_boxes = results["boxes"][keep]
-    keep_scores = results["scores"][keep]
-    keep_labels = results["labels"][keep]
+    with torch.inference_mode():
+        outputs = predictor(**inputs)
+        outputs["encoder_last_hidden_state"] = outputs["encoder_last_hidden_state"].to("cpu")
+        outputs["last_hidden_state"] = outputs["last_hidden_state"].to("cpu")
+        outputs["logits"] = outputs["logits"].to("cpu")
+        outputs["pred_boxes"] = outputs["pred_boxes"].to("cpu")
+        results = feature_extractor.post_process_object_detection(
+            outputs, threshold=threshold, target_sizes=target_sizes
+        )[0]
+        keep = _detr_post_processing(results["boxes"], results["scores"], results["labels"], nms_threshold)
+        keep_boxes = results["boxes"][keep]
+        keep_scores = results["scores"][keep]
+        keep_labels = results["labels"][keep]
     return [
         DetectionResult(box=box.tolist(), score=score.item(), class_id=class_id.item())
         for box, score, class_id in zip(keep_boxes, keep_scores, keep_labels)
@@ -133,26 +133,33 @@ def predict_token_classes(
     :return: A list of TokenClassResults
     """
 
-    if images is None:
-        outputs = model(input_ids=input_ids, bbox=boxes, attention_mask=attention_mask, token_type_ids=token_type_ids)
-    elif isinstance(model, LayoutLMv2ForTokenClassification):
-        outputs = model(
-            input_ids=input_ids, bbox=boxes, attention_mask=attention_mask, token_type_ids=token_type_ids, image=images
-        )
-    elif isinstance(model, LayoutLMv3ForTokenClassification):
-        outputs = model(
-            input_ids=input_ids,
-            bbox=boxes,
-            attention_mask=attention_mask,
-            token_type_ids=token_type_ids,
-            pixel_values=images,
-        )
-    else:
-        raise ValueError(f"Cannot call model {type(model)}")
+    with torch.inference_mode():
+        if images is None:
+            outputs = model(
+                input_ids=input_ids, bbox=boxes, attention_mask=attention_mask, token_type_ids=token_type_ids
+            )
+        elif isinstance(model, LayoutLMv2ForTokenClassification):
+            outputs = model(
+                input_ids=input_ids,
+                bbox=boxes,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids,
+                image=images,
+            )
+        elif isinstance(model, LayoutLMv3ForTokenClassification):
+            outputs = model(
+                input_ids=input_ids,
+                bbox=boxes,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids,
+                pixel_values=images,
+            )
+        else:
+            raise ValueError(f"Cannot call model {type(model)}")
 
-    soft_max = F.softmax(outputs.logits, dim=2)
-    score = torch.max(soft_max, dim=2)[0].tolist()
-    token_class_predictions_ = outputs.logits.argmax(-1).tolist()
+        soft_max = F.softmax(outputs.logits, dim=2)
+        score = torch.max(soft_max, dim=2)[0].tolist()
+        token_class_predictions_ = outputs.logits.argmax(-1).tolist()
     input_ids_list = input_ids.tolist()
 
     all_results = defaultdict(list)
@@ -194,25 +201,32 @@ def predict_sequence_classes(
     :return: SequenceClassResult
     """
 
-    if images is None:
-        outputs = model(input_ids=input_ids, bbox=boxes, attention_mask=attention_mask, token_type_ids=token_type_ids)
-    elif isinstance(model, LayoutLMv2ForSequenceClassification):
-        outputs = model(
-            input_ids=input_ids, bbox=boxes, attention_mask=attention_mask, token_type_ids=token_type_ids, image=images
-        )
-    elif isinstance(model, LayoutLMv3ForSequenceClassification):
-        outputs = model(
-            input_ids=input_ids,
-            bbox=boxes,
-            attention_mask=attention_mask,
-            token_type_ids=token_type_ids,
-            pixel_values=images,
-        )
-    else:
-        raise ValueError(f"Cannot call model {type(model)}")
+    with torch.inference_mode():
+        if images is None:
+            outputs = model(
+                input_ids=input_ids, bbox=boxes, attention_mask=attention_mask, token_type_ids=token_type_ids
+            )
+        elif isinstance(model, LayoutLMv2ForSequenceClassification):
+            outputs = model(
+                input_ids=input_ids,
+                bbox=boxes,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids,
+                image=images,
+            )
+        elif isinstance(model, LayoutLMv3ForSequenceClassification):
+            outputs = model(
+                input_ids=input_ids,
+                bbox=boxes,
+                attention_mask=attention_mask,
+                token_type_ids=token_type_ids,
+                pixel_values=images,
+            )
+        else:
+            raise ValueError(f"Cannot call model {type(model)}")
 
-    score = torch.max(F.softmax(outputs.logits)).tolist()
-    sequence_class_predictions = outputs.logits.argmax(-1).squeeze().tolist()
+        score = torch.max(F.softmax(outputs.logits)).tolist()
+        sequence_class_predictions = outputs.logits.argmax(-1).squeeze().tolist()
 
     return SequenceClassResult(class_id=sequence_class_predictions, score=float(score))  # type: ignore
 
@@ -56,10 +56,11 @@ def predict_sequence_classes(
     :return: SequenceClassResult
     """
 
-    outputs = model(input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids)
+    with torch.inference_mode():
+        outputs = model(input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids)
 
-    score = torch.max(F.softmax(outputs.logits)).tolist()
-    sequence_class_predictions = outputs.logits.argmax(-1).squeeze().tolist()
+        score = torch.max(F.softmax(outputs.logits)).tolist()
+        sequence_class_predictions = outputs.logits.argmax(-1).squeeze().tolist()
 
     return SequenceClassResult(class_id=sequence_class_predictions, score=float(score))  # type: ignore
 
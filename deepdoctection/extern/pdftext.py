@@ -19,11 +19,11 @@
 PDFPlumber text extraction engine
 """
 
+from io import BytesIO
 from typing import Dict, List, Tuple
 
 from lazy_imports import try_import
 
-from ..utils.context import save_tmp_file
 from ..utils.detection_types import Requirement
 from ..utils.file_utils import get_pdfplumber_requirement
 from ..utils.settings import LayoutType, ObjectTypes
@@ -81,12 +81,11 @@ class PdfPlumberTextDetector(PdfMiner):
         :return: A list of DetectionResult
         """
 
-        with save_tmp_file(pdf_bytes, "pdf_") as (tmp_name, _):
-            with open(tmp_name, "rb") as fin:
-                _pdf = PDF(fin)
-                self._page = _pdf.pages[0]
-                self._pdf_bytes = pdf_bytes
-                words = self._page.extract_words(x_tolerance=self.x_tolerance, y_tolerance=self.y_tolerance)
+        with BytesIO(pdf_bytes) as fin:
+            _pdf = PDF(fin)
+            self._page = _pdf.pages[0]
+            self._pdf_bytes = pdf_bytes
+            words = self._page.extract_words(x_tolerance=self.x_tolerance, y_tolerance=self.y_tolerance)
         detect_results = list(map(_to_detect_result, words))
         return detect_results
 
@@ -104,11 +103,10 @@ class PdfPlumberTextDetector(PdfMiner):
         if self._pdf_bytes == pdf_bytes:
             return self._page.bbox[2], self._page.bbox[3]
         # if the pdf bytes is not equal to the cached pdf, will recalculate values
-        with save_tmp_file(pdf_bytes, "pdf_") as (tmp_name, _):
-            with open(tmp_name, "rb") as fin:
-                _pdf = PDF(fin)
-                self._page = _pdf.pages[0]
-                self._pdf_bytes = pdf_bytes
+        with BytesIO(pdf_bytes) as fin:
+            _pdf = PDF(fin)
+            self._page = _pdf.pages[0]
+            self._pdf_bytes = pdf_bytes
         return self._page.bbox[2], self._page.bbox[3]
 
     def possible_categories(self) -> List[ObjectTypes]:
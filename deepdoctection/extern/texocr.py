@@ -34,6 +34,7 @@ from .base import DetectionResult, ObjectDetector, PredictorBase
 
 with try_import() as import_guard:
     import boto3  # type:ignore
+    from botocore.exceptions import BotoCoreError, ClientError  # type:ignore
 
 
 def _textract_to_detectresult(response: JsonDict, width: int, height: int, text_lines: bool) -> List[DetectionResult]:
@@ -42,18 +43,22 @@ def _textract_to_detectresult(response: JsonDict, width: int, height: int, text_
 
     if blocks:
         for block in blocks:
-            if (block["BlockType"] in "WORD") or (block["BlockType"] in "LINE" and text_lines):
+            block_type = block["BlockType"]
+            if (block_type in "WORD") or (block_type in "LINE" and text_lines):
+                polygon = block["Geometry"]["Polygon"]
+                upper_left, lower_right = polygon[0], polygon[2]
+                is_word = block_type == "WORD"
                 word = DetectionResult(
                     box=[
-                        block["Geometry"]["Polygon"][0]["X"] * width,
-                        block["Geometry"]["Polygon"][0]["Y"] * height,
-                        block["Geometry"]["Polygon"][2]["X"] * width,
-                        block["Geometry"]["Polygon"][2]["Y"] * height,
+                        upper_left["X"] * width,
+                        upper_left["Y"] * height,
+                        lower_right["X"] * width,
+                        lower_right["Y"] * height,
                     ],
                     score=block["Confidence"] / 100,
                     text=block["Text"],
-                    class_id=1 if block["BlockType"] == "WORD" else 2,
-                    class_name=LayoutType.word if block["BlockType"] == "WORD" else LayoutType.line,
+                    class_id=1 if is_word else 2,
+                    class_name=LayoutType.word if is_word else LayoutType.line,
                 )
                 all_results.append(word)
 
@@ -75,7 +80,7 @@ def predict_text(np_img: ImageType, client, text_lines: bool) -> List[DetectionR
     b_img = convert_np_array_to_b64_b(np_img)
     try:
         response = client.detect_document_text(Document={"Bytes": b_img})
-    except:  # pylint: disable=W0702
+    except (BotoCoreError, ClientError):
         _, exc_val, exc_tb = sys.exc_info()
         frame_summary = traceback.extract_tb(exc_tb)[0]
         log_dict = {
@@ -92,14 +92,15 @@ def re_assign_cat_ids(
     anns_to_remove: List[ImageAnnotation] = []
     for ann in dp.get_annotation_iter():
         if categories_dict_name_as_key is not None:
-            if ann.category_name in categories_dict_name_as_key:
-                ann.category_id = categories_dict_name_as_key[ann.category_name]
+            category_id = categories_dict_name_as_key.get(ann.category_name)
+            if category_id is not None:
+                ann.category_id = category_id
             else:
                 anns_to_remove.append(ann)
 
         if cat_to_sub_cat_mapping:
-            if ann.category_name in cat_to_sub_cat_mapping:
-                sub_cat_keys_to_sub_cat_values = cat_to_sub_cat_mapping[get_type(ann.category_name)]
+            sub_cat_keys_to_sub_cat_values = cat_to_sub_cat_mapping.get(get_type(ann.category_name))
+            if sub_cat_keys_to_sub_cat_values is not None:
                 for key in sub_cat_keys_to_sub_cat_values:
                     sub_cat_values_dict = sub_cat_keys_to_sub_cat_values[key]
                     sub_category = ann.get_sub_category(key)
@@ -253,21 +254,20 @@ def image_to_cat_id(
         for ann in dp.get_annotation_iter():
             if ann.category_name in category_names:
                 cat_container[ann.category_name].append(int(ann.category_id))
-            if ann.category_name in tmp_sub_category_names:
-                for sub_cat_name in tmp_sub_category_names[ann.category_name]:
-                    sub_cat = ann.get_sub_category(get_type(sub_cat_name))
-                    if sub_cat is not None:
-                        if id_name_or_value == "id":
-                            cat_container[sub_cat_name].append(int(sub_cat.category_id))
-                        if id_name_or_value == "name":
-                            cat_container[sub_cat_name].append(sub_cat.category_name)  # type: ignore
-                        if id_name_or_value == "value":
-                            if not isinstance(sub_cat, ContainerAnnotation):
-                                raise ValueError(
-                                    f"sub category {sub_cat_name} does not have a ContainerAnnotation. Choose another"
-                                    f"value for argument id_name_or_value"
-                                )
-                            cat_container[sub_cat_name].append(sub_cat.value)  # type: ignore
+            for sub_cat_name in tmp_sub_category_names.get(ann.category_name, ()):
+                sub_cat = ann.get_sub_category(get_type(sub_cat_name))
+                if sub_cat is not None:
+                    if id_name_or_value == "id":
+                        cat_container[sub_cat_name].append(int(sub_cat.category_id))
+                    if id_name_or_value == "name":
+                        cat_container[sub_cat_name].append(sub_cat.category_name)  # type: ignore
+                    if id_name_or_value == "value":
+                        if not isinstance(sub_cat, ContainerAnnotation):
+                            raise ValueError(
+                                f"sub category {sub_cat_name} does not have a ContainerAnnotation. Choose another"
+                                f"value for argument id_name_or_value"
+                            )
+                        cat_container[sub_cat_name].append(sub_cat.value)  # type: ignore
 
     if dp.summary is not None and summary_sub_category_names:
         for sub_cat_name in summary_sub_category_names:
@@ -327,14 +327,14 @@ def remove_cats(
     for ann in dp.get_annotation_iter():
         if ann.category_name in category_names:
             anns_to_remove.append(ann)
-        if ann.category_name in sub_categories.keys():
-            sub_cats_to_remove = sub_categories[ann.category_name]
+        sub_cats_to_remove = sub_categories.get(ann.category_name)
+        if sub_cats_to_remove is not None:
             if isinstance(sub_cats_to_remove, str):
                 sub_cats_to_remove = [sub_cats_to_remove]
             for sub_cat in sub_cats_to_remove:
                 ann.remove_sub_category(get_type(sub_cat))
-        if ann.category_name in relationships.keys():
-            relationships_to_remove = relationships[ann.category_name]
+        relationships_to_remove = relationships.get(ann.category_name)
+        if relationships_to_remove is not None:
             if isinstance(relationships_to_remove, str):
                 relationships_to_remove = [relationships_to_remove]
             for relation in relationships_to_remove:
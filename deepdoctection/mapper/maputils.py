@@ -197,7 +197,7 @@ class LabelSummarizer:
         :param categories: A dict of categories as given as in categories.get_categories().
         """
         self.categories = categories
-        cat_numbers = len(self.categories.keys())
+        cat_numbers = len(self.categories)
         self.hist_bins = np.arange(1, cat_numbers + 2)
         self.summary = np.zeros(cat_numbers)
 
@@ -214,7 +214,7 @@ class LabelSummarizer:
         """
         Get a dictionary with category ids and the number dumped
         """
-        return dict(list(zip(self.categories.keys(), self.summary.astype(np.int32))))
+        return dict(zip(self.categories, self.summary.astype(np.int32)))
 
     def print_summary_histogram(self, dd_logic: bool = True) -> None:
         """
@@ -20,6 +20,7 @@ Module for mapping annotations in pubtabnet style structure
 """
 import itertools
 import os
+from bisect import bisect_left
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
@@ -36,6 +37,8 @@ from .maputils import MappingContextManager, curry, maybe_get_fake_score
 
 __all__ = ["pub_to_image"]
 
+_DELETE_QUOTES = str.maketrans("", "", '"')
+
 
 def _convert_boxes(dp: JsonDict, height: int) -> JsonDict:
     if "bbox" in dp:
@@ -60,46 +63,40 @@ def _get_table_annotation(dp: JsonDict, category_id: str) -> ImageAnnotation:
 
 
 def _cell_token(html: Sequence[str]) -> List[List[int]]:
-    index_rows = [i for i, tag in enumerate(html) if tag == "<tr>"]
-    index_cells = [i for i, tag in enumerate(html) if tag in ("<td>", ">")]
-    index_rows_tmp = [(index_rows[i], index_rows[i + 1]) for i in range(len(index_rows) - 1)]
-    index_rows_tmp.append((index_rows[-1], index_cells[-1]))
-    index_cells_tmp = [
-        [index_cell for index_cell in index_cells if index_rows_tmp[i][0] < index_cell < index_rows_tmp[i][1]]
-        for i in range(len(index_rows_tmp))
-    ]
-    index_cells_tmp[-1].append(index_cells[-1])
+    index_rows: List[int] = []
+    index_cells: List[int] = []
+    for i, tag in enumerate(html):
+        if tag == "<tr>":
+            index_rows.append(i)
+        elif tag in ("<td>", ">"):
+            index_cells.append(i)
+    last_row, last_cell = len(index_rows) - 1, index_cells[-1]
+    index_cells_tmp: List[List[int]] = [[] for _ in index_rows]
+    for index_cell in index_cells:
+        row = bisect_left(index_rows, index_cell) - 1
+        if row >= 0 and (row < last_row or index_cell < last_cell):
+            index_cells_tmp[row].append(index_cell)
+    index_cells_tmp[-1].append(last_cell)
     return index_cells_tmp
 
 
 def _item_spans(html: Sequence[str], index_cells: Sequence[Sequence[int]], item: str) -> List[List[int]]:
-    item_spans = [
-        [
-            (
-                int(html[index_cell - 1].replace(item + "=", "").replace('"', ""))
-                if (item in html[index_cell - 1] and html[index_cell] == ">")
-                else (
-                    int(html[index_cell - 2].replace(item + "=", "").replace('"', ""))
-                    if (item in html[index_cell - 2] and html[index_cell] == ">")
-                    else 1
-                )
-            )
-            for index_cell in index_cell_per_row
-        ]
-        for index_cell_per_row in index_cells
-    ]
-    return item_spans
+    item_prefix = item + "="
+
+    def _item_span(index_cell: int) -> int:
+        if html[index_cell] == ">":
+            for tag in (html[index_cell - 1], html[index_cell - 2]):
+                if item in tag:
+                    return int(tag.replace(item_prefix, "").translate(_DELETE_QUOTES))
+        return 1
+
+    return [[_item_span(index_cell) for index_cell in index_cell_per_row] for index_cell_per_row in index_cells]
 
 
 def _end_of_header(html: Sequence[str]) -> int:
-    index_cells = [i for i, tag in enumerate(html) if tag in ("<td>", ">")]
-    header_in_html = [i for i, tag in enumerate(html) if tag == "</thead>"]
-    index_header_end = max(header_in_html)
-    index_header = [i for i in index_cells if i < index_header_end]
-    if len(index_header):
-        last_index_header_cell = max(index_header)
-        return index_cells.index(last_index_header_cell) + 1
-    return 0
+    index_header_end = max(i for i, tag in enumerate(html) if tag == "</thead>")
+    # number of cell tokens before </thead>
+    return sum(1 for tag in itertools.islice(html, index_header_end) if tag in ("<td>", ">"))
 
 
 def tile_table(row_spans: Sequence[Sequence[int]], col_spans: Sequence[Sequence[int]]) -> List[List[int]]:
@@ -166,15 +163,18 @@ def _add_items(image: Image, item_type: str, categories_name_as_key: Dict[str, s
         number_of_items = int(category_item.category_id)
 
     cells = image.get_annotation(category_names=LayoutType.cell)
+    tables = image.get_annotation(category_names=LayoutType.table) if pubtables_like else []
     table: ImageAnnotation
 
+    # group cells by item number
+    cells_per_item: Dict[str, List[ImageAnnotation]] = {}
+    for cell in cells:
+        cell_item_number = cell.get_sub_category(item_number).category_id
+        if cell.get_sub_category(item_span).category_id == "1":
+            cells_per_item.setdefault(cell_item_number, []).append(cell)
+
     for item_num in range(1, number_of_items + 1):
-        cell_item = list(
-            filter(
-                lambda x: x.get_sub_category(item_number).category_id == str(item_num), cells  # pylint: disable=W0640
-            )
-        )
-        cell_item = list(filter(lambda x: x.get_sub_category(item_span).category_id == "1", cell_item))
+        cell_item = cells_per_item.get(str(item_num))
         if cell_item:
             ulx = min(cell.bounding_box.ulx for cell in cell_item if isinstance(cell.bounding_box, BoundingBox))
 
@@ -185,7 +185,6 @@ def _add_items(image: Image, item_type: str, categories_name_as_key: Dict[str, s
             lry = max(cell.bounding_box.lry for cell in cell_item if isinstance(cell.bounding_box, BoundingBox))
 
             if pubtables_like:
-                tables = image.get_annotation(category_names=LayoutType.table)
                 if not tables:
                     raise ValueError("pubtables_like = True requires table")
                 table = tables[0]
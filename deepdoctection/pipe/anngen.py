@@ -19,7 +19,7 @@
 Module for datapoint populating helpers
 """
 from dataclasses import asdict
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -205,8 +205,38 @@ class DatapointManager:
         :return: the annotation_id of the generated category annotation
         """
         self.assert_datapoint_passed()
+        return self._dump_category_annotation(
+            self.datapoint.file_name, category_name, category_id, sub_cat_key, annotation_id, score
+        )
+
+    def set_category_annotations(
+        self, category_annotations: Sequence[Tuple[ObjectTypes, Optional[Union[str, int]], ObjectTypes, str]]
+    ) -> List[Optional[str]]:
+        """
+        Create several category annotations at once and dump each of them as sub category to an already created
+        annotation. Same as calling `set_category_annotation` for every tuple, but the datapoint is checked only once.
+
+        :param category_annotations: A sequence of (category_name, category_id, sub_cat_key, annotation_id) tuples.
+        :return: the annotation_ids of the generated category annotations
+        """
+        self.assert_datapoint_passed()
+        dp_name = self.datapoint.file_name
+        return [
+            self._dump_category_annotation(dp_name, category_name, category_id, sub_cat_key, annotation_id)
+            for category_name, category_id, sub_cat_key, annotation_id in category_annotations
+        ]
+
+    def _dump_category_annotation(
+        self,
+        dp_name: str,
+        category_name: ObjectTypes,
+        category_id: Optional[Union[str, int]],
+        sub_cat_key: ObjectTypes,
+        annotation_id: str,
+        score: Optional[float] = None,
+    ) -> Optional[str]:
         with MappingContextManager(
-            dp_name=self.datapoint.file_name,
+            dp_name=dp_name,
             filter_level="annotation",
             category_annotation={
                 "category_name": category_name.value,
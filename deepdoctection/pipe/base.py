@@ -128,12 +128,10 @@ class PipelineComponent(ABC):
         raise NotImplementedError()
 
     def _meta_has_all_types(self) -> None:
-        if not {"image_annotations", "sub_categories", "relationships", "summaries"}.issubset(
-            set(self.get_meta_annotation().keys())
-        ):
+        meta_annotation = self.get_meta_annotation()
+        if not {"image_annotations", "sub_categories", "relationships", "summaries"}.issubset(meta_annotation):
             raise TypeError(
-                f" 'get_meta_annotation' must return dict with all required keys. "
-                f"Got {self.get_meta_annotation().keys()}"
+                f" 'get_meta_annotation' must return dict with all required keys. Got {meta_annotation.keys()}"
             )
 
     def get_service_id(self) -> str:
@@ -70,7 +70,7 @@ class ImageCroppingService(PipelineComponent):
         return self.__class__(self.category_names)
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict([("image_annotations", []), ("sub_categories", {}), ("relationships", {}), ("summaries", [])])
+        return {"image_annotations": [], "sub_categories": {}, "relationships": {}, "summaries": []}
 
 
 @pipeline_component_registry.register("MatchingService")
@@ -158,14 +158,12 @@ class MatchingService(PipelineComponent):
         return self.__class__(self.parent_categories, self.child_categories, self.matching_rule, self.threshold)
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                ("sub_categories", {}),
-                ("relationships", {parent: {Relationships.child} for parent in self.parent_categories}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {},
+            "relationships": {parent: {Relationships.child} for parent in self.parent_categories},
+            "summaries": [],
+        }
 
 
 @pipeline_component_registry.register("PageParsingService")
@@ -225,7 +223,7 @@ class PageParsingService:
         """
         meta annotation. We do not generate any new annotations here
         """
-        return dict([("image_annotations", []), ("sub_categories", {}), ("relationships", {}), ("summaries", [])])
+        return {"image_annotations": [], "sub_categories": {}, "relationships": {}, "summaries": []}
 
     def clone(self) -> PageParsingService:
         """clone"""
@@ -298,7 +296,7 @@ class AnnotationNmsService(PipelineComponent):
         return self.__class__(deepcopy(self.nms_pairs), self.threshold)
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict([("image_annotations", []), ("sub_categories", {}), ("relationships", {}), ("summaries", [])])
+        return {"image_annotations": [], "sub_categories": {}, "relationships": {}, "summaries": []}
 
 
 @pipeline_component_registry.register("ImageParsingService")
@@ -337,4 +335,4 @@ class ImageParsingService:
         """
         meta annotation. We do not generate any new annotations here
         """
-        return dict([("image_annotations", []), ("sub_categories", {}), ("relationships", {}), ("summaries", [])])
+        return {"image_annotations": [], "sub_categories": {}, "relationships": {}, "summaries": []}
@@ -108,14 +108,12 @@ class LanguageDetectionService(PipelineComponent):
         )
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                ("sub_categories", {}),
-                ("relationships", {}),
-                ("summaries", [PageType.language]),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {},
+            "relationships": {},
+            "summaries": [PageType.language],
+        }
 
     @staticmethod
     def _get_name(predictor_name: str) -> str:
@@ -98,14 +98,12 @@ class ImageLayoutService(PredictorPipelineComponent):
 
     def get_meta_annotation(self) -> JsonDict:
         assert isinstance(self.predictor, (ObjectDetector, PdfMiner))
-        return dict(
-            [
-                ("image_annotations", self.predictor.possible_categories()),
-                ("sub_categories", {}),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": self.predictor.possible_categories(),
+            "sub_categories": {},
+            "relationships": {},
+            "summaries": [],
+        }
 
     @staticmethod
     def _get_name(predictor_name: str) -> str:
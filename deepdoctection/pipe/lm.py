@@ -21,7 +21,7 @@ Module for token classification pipeline
 from __future__ import annotations
 
 from copy import copy
-from typing import Any, Callable, List, Literal, Optional, Sequence, Union
+from typing import Any, Callable, Literal, Optional, Sequence, Set, Union
 
 from ..datapoint.image import Image
 from ..extern.hflayoutlm import HFLayoutLmSequenceClassifierBase, HFLayoutLmTokenClassifierBase
@@ -118,6 +118,9 @@ class LMTokenClassifierService(LanguageModelPipelineComponent):
             self.other_name_as_key = {self.default_key: categories_name_as_key[self.default_key]}
         image_to_features_func = self.image_to_features_func(self.language_model.image_to_features_mapping())
         super().__init__(self._get_name(), tokenizer, image_to_features_func)
+        self._special_token_ids = frozenset(
+            (self.tokenizer.cls_token_id, self.tokenizer.sep_token_id, self.tokenizer.pad_token_id)
+        )
         self.required_kwargs = {
             "tokenizer": self.tokenizer,
             "padding": self.padding,
@@ -140,45 +143,40 @@ class LMTokenClassifierService(LanguageModelPipelineComponent):
         lm_output = [
             token
             for token in lm_output
-            if token.token_id
-            not in [self.tokenizer.cls_token_id, self.tokenizer.sep_token_id, self.tokenizer.pad_token_id]
-            and not token.token.startswith("##")
+            if token.token_id not in self._special_token_ids and not token.token.startswith("##")
         ]
 
-        words_populated: List[str] = []
+        words_populated: Set[str] = set()
+        category_annotations = []
         for token in lm_output:
             if token.uuid not in words_populated:
                 if token.class_name == token.semantic_name:
                     token_class_name_id = token.class_id
                 else:
                     token_class_name_id = None
-                self.dp_manager.set_category_annotation(
-                    token.semantic_name, token_class_name_id, WordType.token_class, token.uuid
-                )
-                self.dp_manager.set_category_annotation(token.bio_tag, None, WordType.tag, token.uuid)
-                self.dp_manager.set_category_annotation(
-                    token.class_name, token.class_id, WordType.token_tag, token.uuid
+                category_annotations.append(
+                    (token.semantic_name, token_class_name_id, WordType.token_class, token.uuid)
                 )
-                words_populated.append(token.uuid)
+                category_annotations.append((token.bio_tag, None, WordType.tag, token.uuid))
+                category_annotations.append((token.class_name, token.class_id, WordType.token_tag, token.uuid))
+                words_populated.add(token.uuid)
+        self.dp_manager.set_category_annotations(category_annotations)
 
         if self.use_other_as_default_category:
-            word_anns = dp.get_annotation(LayoutType.word)
-            for word in word_anns:
+            default_category_id = self.other_name_as_key[self.default_key]
+            for word in dp.get_annotation(LayoutType.word):
+                # words that received a prediction above have all three sub categories already
+                if word.annotation_id in words_populated:
+                    continue
                 if WordType.token_class not in word.sub_categories:
                     self.dp_manager.set_category_annotation(
-                        TokenClasses.other,
-                        self.other_name_as_key[self.default_key],
-                        WordType.token_class,
-                        word.annotation_id,
+                        TokenClasses.other, default_category_id, WordType.token_class, word.annotation_id
                     )
                 if WordType.tag not in word.sub_categories:
                     self.dp_manager.set_category_annotation(BioTag.outside, None, WordType.tag, word.annotation_id)
                 if WordType.token_tag not in word.sub_categories:
                     self.dp_manager.set_category_annotation(
-                        self.default_key,
-                        self.other_name_as_key[self.default_key],
-                        WordType.token_tag,
-                        word.annotation_id,
+                        self.default_key, default_category_id, WordType.token_tag, word.annotation_id
                     )
 
     def clone(self) -> LMTokenClassifierService:
@@ -196,14 +194,12 @@ class LMTokenClassifierService(LanguageModelPipelineComponent):
         )
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                ("sub_categories", {LayoutType.word: {WordType.token_class, WordType.tag, WordType.token_tag}}),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {LayoutType.word: {WordType.token_class, WordType.tag, WordType.token_tag}},
+            "relationships": {},
+            "summaries": [],
+        }
 
     def _get_name(self) -> str:
         return f"lm_token_class_{self.language_model.name}"
@@ -312,14 +308,12 @@ class LMSequenceClassifierService(LanguageModelPipelineComponent):
         )
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                ("sub_categories", {}),
-                ("relationships", {}),
-                ("summaries", [PageType.document_type]),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {},
+            "relationships": {},
+            "summaries": [PageType.document_type],
+        }
 
     def _get_name(self) -> str:
         return f"lm_sequence_class_{self.language_model.name}"
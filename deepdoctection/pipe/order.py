@@ -553,14 +553,12 @@ class TextLineService(TextLineServiceMixin):
         """
         This method returns metadata about the annotations created by this pipeline component.
         """
-        return dict(
-            [
-                ("image_annotations", [LayoutType.line]),
-                ("sub_categories", {LayoutType.line: {Relationships.child}}),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": [LayoutType.line],
+            "sub_categories": {LayoutType.line: {Relationships.child}},
+            "relationships": {},
+            "summaries": [],
+        }
 
 
 @pipeline_component_registry.register("TextOrderService")
@@ -749,14 +747,12 @@ class TextOrderService(TextLineServiceMixin):
             add_category.append(LayoutType.line)
             image_annotations.append(LayoutType.line)
         anns_with_reading_order = list(copy(self.floating_text_block_categories)) + add_category
-        return dict(
-            [
-                ("image_annotations", image_annotations),
-                ("sub_categories", {category: {Relationships.reading_order} for category in anns_with_reading_order}),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": image_annotations,
+            "sub_categories": {category: {Relationships.reading_order} for category in anns_with_reading_order},
+            "relationships": {},
+            "summaries": [],
+        }
 
     def clone(self) -> PipelineComponent:
         return self.__class__(
@@ -497,22 +497,17 @@ class TableSegmentationRefinementService(PipelineComponent):
         return self.__class__(self.table_name, self.cell_names)
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                (
-                    "sub_categories",
-                    {
-                        LayoutType.cell: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        LayoutType.table: {TableType.html},
-                    },
-                ),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {
+                LayoutType.cell: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                LayoutType.table: {TableType.html},
+            },
+            "relationships": {},
+            "summaries": [],
+        }
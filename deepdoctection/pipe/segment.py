@@ -814,26 +814,21 @@ class TableSegmentationService(PipelineComponent):
         )
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                (
-                    "sub_categories",
-                    {
-                        LayoutType.cell: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        LayoutType.row: {CellType.row_number},
-                        LayoutType.column: {CellType.column_number},
-                    },
-                ),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {
+                LayoutType.cell: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                LayoutType.row: {CellType.row_number},
+                LayoutType.column: {CellType.column_number},
+            },
+            "relationships": {},
+            "summaries": [],
+        }
 
 
 class PubtablesSegmentationService(PipelineComponent):
@@ -1061,47 +1056,42 @@ class PubtablesSegmentationService(PipelineComponent):
         )
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                (
-                    "sub_categories",
-                    {
-                        LayoutType.cell: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        CellType.spanning: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        CellType.row_header: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        CellType.column_header: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        CellType.projected_row_header: {
-                            CellType.row_number,
-                            CellType.column_number,
-                            CellType.row_span,
-                            CellType.column_span,
-                        },
-                        LayoutType.row: {CellType.row_number},
-                        LayoutType.column: {CellType.column_number},
-                    },
-                ),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {
+                LayoutType.cell: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                CellType.spanning: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                CellType.row_header: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                CellType.column_header: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                CellType.projected_row_header: {
+                    CellType.row_number,
+                    CellType.column_number,
+                    CellType.row_span,
+                    CellType.column_span,
+                },
+                LayoutType.row: {CellType.row_number},
+                LayoutType.column: {CellType.column_number},
+            },
+            "relationships": {},
+            "summaries": [],
+        }
@@ -205,15 +205,13 @@ class SubImageLayoutService(PredictorPipelineComponent):
 
     def get_meta_annotation(self) -> JsonDict:
         assert isinstance(self.predictor, (ObjectDetector, PdfMiner))
-        return dict(
-            [
-                ("image_annotations", self.predictor.possible_categories()),
-                ("sub_categories", {}),
-                # implicit setup of relations by using set_image_annotation with explicit annotation_id
-                ("relationships", {parent: {Relationships.child} for parent in self.sub_image_name}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": self.predictor.possible_categories(),
+            "sub_categories": {},
+            # implicit setup of relations by using set_image_annotation with explicit annotation_id
+            "relationships": {parent: {Relationships.child} for parent in self.sub_image_name},
+            "summaries": [],
+        }
 
     @staticmethod
     def _get_name(predictor_name: str) -> str:
@@ -201,21 +201,14 @@ class TextExtractionService(PredictorPipelineComponent):
                     f"{type(self.predictor)}"
                 )
             sub_cat_dict = {category: {WordType.characters} for category in self.predictor.possible_categories()}
-        return dict(
-            [
-                (
-                    "image_annotations",
-                    (
-                        self.predictor.possible_categories()
-                        if isinstance(self.predictor, (ObjectDetector, PdfMiner))
-                        else []
-                    ),
-                ),
-                ("sub_categories", sub_cat_dict),
-                ("relationships", {}),
-                ("summaries", []),
-            ]
-        )
+        return {
+            "image_annotations": (
+                self.predictor.possible_categories() if isinstance(self.predictor, (ObjectDetector, PdfMiner)) else []
+            ),
+            "sub_categories": sub_cat_dict,
+            "relationships": {},
+            "summaries": [],
+        }
 
     @staticmethod
     def _get_name(text_detector_name: str) -> str:
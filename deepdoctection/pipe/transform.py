@@ -71,14 +71,12 @@ class SimpleTransformService(ImageTransformPipelineComponent):
         return self.__class__(self.transform_predictor)
 
     def get_meta_annotation(self) -> JsonDict:
-        return dict(
-            [
-                ("image_annotations", []),
-                ("sub_categories", {}),
-                ("relationships", {}),
-                ("summaries", [self.transform_predictor.possible_category()]),
-            ]
-        )
+        return {
+            "image_annotations": [],
+            "sub_categories": {},
+            "relationships": {},
+            "summaries": [self.transform_predictor.possible_category()],
+        }
 
     @staticmethod
     def _get_name(transform_name: str) -> str:
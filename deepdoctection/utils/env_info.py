@@ -48,7 +48,6 @@ can store an (absolute) path to a `.jsonl` file.
 
 import importlib
 import os
-import re
 import subprocess
 import sys
 from collections import defaultdict
@@ -244,11 +243,13 @@ def detect_compute_compatibility(cuda_home: Optional[str], so_file: Optional[str
         cuobjdump = os.path.join(cuda_home, "bin", "cuobjdump")  # type: ignore
         if os.path.isfile(cuobjdump):
             output = subprocess.check_output(f"'{cuobjdump}' --list-elf '{so_file}'", shell=True)
-            output = output.decode("utf-8").strip().split("\n")  # type: ignore
+            lines: List[str] = output.decode("utf-8").strip().split("\n")
             arch = []
-            for line in output:
-                line = re.findall(r"\.sm_([0-9]*)\.", line)[0]  # type: ignore
-                arch.append(".".join(line))  # type: ignore
+            for line in lines:
+                _, sm_prefix, tail = line.partition(".sm_")
+                if not sm_prefix:
+                    continue
+                arch.append(".".join(tail.partition(".")[0]))
             arch = sorted(set(arch))
             return ", ".join(arch)
         return str(so_file) + "; cannot find cuobjdump"
@@ -700,7 +700,7 @@ class _LazyModule(ModuleType):
             return self._objects[name]
         if name in self._modules:
             value = self._get_module(name)
-        elif name in self._class_to_module.keys():  # pylint: disable=C0201
+        elif name in self._class_to_module:
             module = self._get_module(self._class_to_module[name])
             value = getattr(module, name)
         else:
@@ -89,28 +89,32 @@ def get_pdf_file_reader(path: Pathlike) -> PdfReader:
         raise FileExtensionError(f"must be a pdf file: {file_name}")
 
     with open(path, "rb") as file:
-        qpdf_called = False
-        try:
-            input_pdf_as_bytes = PdfReader(file)
-        except (errors.PdfReadError, AttributeError):
-            _ = decrypt_pdf_document(path)
-            qpdf_called = True
-
-        if not qpdf_called:
-            if input_pdf_as_bytes.is_encrypted:
-                is_decrypted = decrypt_pdf_document(path)
-                if not is_decrypted:
-                    logger.error(
-                        LoggingRecord(
-                            f"pdf document {path} cannot be decrypted and therefore cannot be " f"processed further."
-                        )
-                    )
-                    sys.exit()
-
-    file_reader = PdfReader(open(path, "rb"))  # pylint: disable=R1732
+        input_pdf_as_bytes = file.read()
+
+    # decrypt_pdf_document rewrites the file in place, so it has to be read again afterwards
+    try:
+        file_reader = PdfReader(BytesIO(input_pdf_as_bytes))
+    except (errors.PdfReadError, AttributeError):
+        _ = decrypt_pdf_document(path)
+        return _read_pdf_file(path)
+
+    if file_reader.is_encrypted:
+        is_decrypted = decrypt_pdf_document(path)
+        if not is_decrypted:
+            logger.error(
+                LoggingRecord(f"pdf document {path} cannot be decrypted and therefore cannot be processed further.")
+            )
+            sys.exit()
+        return _read_pdf_file(path)
+
     return file_reader
 
 
+def _read_pdf_file(path: Pathlike) -> PdfReader:
+    with open(path, "rb") as file:
+        return PdfReader(BytesIO(file.read()))
+
+
 def get_pdf_file_writer() -> PdfWriter:
     """
     `PdfWriter` instance
@@ -22,7 +22,7 @@ Module for funcs and constants that maintain general settings
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Optional, Set, Tuple, Union
 
 import catalogue  # type: ignore
 
@@ -383,16 +383,16 @@ def _get_new_obj_type_str(obj_type: str) -> str:
     return _OLD_TO_NEW_OBJ_TYPE.get(obj_type, obj_type)
 
 
-_BLACK_LIST: List[str] = ["B", "I", "O", "E", "S"]
+_BLACK_LIST: Set[str] = {"B", "I", "O", "E", "S"}
 
 
-def _get_black_list() -> List[str]:
+def _get_black_list() -> Set[str]:
     return _BLACK_LIST
 
 
 def update_black_list(item: str) -> None:
     """Updates the black list, i.e. set of elements that must not be lowered"""
-    _BLACK_LIST.append(item)
+    _BLACK_LIST.add(item)
 
 
 def get_type(obj_type: Union[str, ObjectTypes]) -> ObjectTypes:
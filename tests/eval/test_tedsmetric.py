@@ -21,10 +21,13 @@ Testing module eval.tedsmetric
 
 from pytest import mark
 
-from deepdoctection.utils.file_utils import apted_available
+from deepdoctection.utils.file_utils import apted_available, lxml_available
 
 if apted_available():
-    from deepdoctection.eval.tedsmetric import teds_metric
+    from deepdoctection.eval.tedsmetric import TEDS, teds_metric
+
+if lxml_available():
+    from lxml import etree
 
 
 @mark.additional
@@ -38,3 +41,38 @@ def test_teds_metric_returns_correct_distance() -> None:
 
     assert number_results == 1
     assert results == 1.0
+
+
+@mark.additional
+def test_teds_tokenize_keeps_text_after_comment() -> None:
+    """
+    tokenize keeps the text that follows a comment inside a cell
+    """
+
+    node = etree.fromstring("<td>a<!-- c -->b</td>", parser=etree.XMLParser())
+
+    tokens = TEDS.tokenize(node)
+
+    assert tokens[:2] == ["<td>", "a"]
+    assert tokens[-2:] == ["b", "</td>"]
+
+
+@mark.additional
+def test_teds_tokenize_returns_fresh_tokens_and_evaluate_is_stable() -> None:
+    """
+    tokenize does not share tokens between calls and repeated evaluate calls on one instance give the same score
+    """
+
+    node = etree.fromstring("<td>ab</td>", parser=etree.XMLParser())
+    teds = TEDS()
+    pred = "<html><body><table><tr><td>ab</td><td>x</td></tr></table></body></html>"
+    true = "<html><body><table><tr><td>ab</td><td>y</td></tr></table></body></html>"
+
+    first_tokens = TEDS.tokenize(node)
+    second_tokens = TEDS.tokenize(node)
+    scores = [teds.evaluate((pred, true)) for _ in range(3)]
+
+    assert first_tokens == second_tokens == ["<td>", "a", "b", "</td>"]
+    assert first_tokens is not second_tokens
+    assert len(set(scores)) == 1
+    assert scores[0] < 1.0
@@ -122,6 +122,34 @@ class TestDatapointManager:
         assert cat_ann.score == 0.8
         assert cat_ann.category_name == "foo"
 
+    @staticmethod
+    @mark.basic
+    def test_set_category_annotations(dp_image: Image, layout_detect_results: List[DetectionResult]) -> None:
+        """
+        test set_category_annotations
+        """
+
+        # Arrange
+        dp_manager = DatapointManager(service_id="test_service", model_id="test_model")
+        dp_manager.datapoint = dp_image
+        ann_id = dp_manager.set_image_annotation(layout_detect_results[0])
+
+        # Act
+        assert ann_id is not None
+        cat_ann_ids = dp_manager.set_category_annotations(
+            [(get_type("foo"), 5, get_type("FOO"), ann_id), (get_type("bak"), None, get_type("BAK"), ann_id)]
+        )
+
+        # Assert
+        ann = dp_manager.datapoint.get_annotation(annotation_ids=ann_id)
+        foo_ann = ann[0].get_sub_category(get_type("FOO"))
+        bak_ann = ann[0].get_sub_category(get_type("BAK"))
+
+        assert cat_ann_ids == [foo_ann.annotation_id, bak_ann.annotation_id]
+        assert foo_ann.category_id == "5"
+        assert foo_ann.category_name == "foo"
+        assert bak_ann.category_name == "bak"
+
     @staticmethod
     @mark.basic
     def test_set_container_annotation(dp_image: Image, layout_detect_results: List[DetectionResult]) -> None: